@@ -1,8 +1,13 @@
 """Telegram Bot."""
+import hashlib
 import logging
 import os
+import random
+import signal
 import sys
 import time
+from collections import OrderedDict
+from contextlib import suppress
 from http import HTTPStatus
 
 import requests
@@ -11,11 +16,18 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
 PRACTICUM_TOKEN = os.getenv("PRACTICUM_TOKEN")
 TELEGRAM_TOKEN = os.getenv("TELEGRAM_TOKEN")
 TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID")
 
 RETRY_PERIOD = int(os.getenv("RETRY_TIME", 600))
+MAX_RETRY_PERIOD = 3600
+REQUEST_TIMEOUT = (1.0, 10.0)
+SENT_MESSAGES_LIMIT = int(os.getenv("SENT_MESSAGES_LIMIT", 64))
+SENT_MESSAGES_TTL = int(os.getenv("SENT_MESSAGES_TTL", 0))
 ENDPOINT = "https://practicum.yandex.ru/api/user_api/homework_statuses/"
 HEADERS = {"Authorization": f"OAuth {PRACTICUM_TOKEN}"}
 
@@ -24,46 +36,68 @@ HOMEWORK_VERDICTS = {
     "reviewing": "Работа взята на проверку ревьюером.",
     "rejected": "Работа проверена: у ревьюера есть замечания.",
 }
+HOMEWORK_VERDICT_MESSAGES = {
+    status: f'Изменился статус проверки работы "{{name}}". {verdict}'
+    for status, verdict in HOMEWORK_VERDICTS.items()
+}
+ERROR_PREFIXES = {
+    ConnectionError: "Ошибка соединения",
+    TypeError: "Объект несоответствующего типа",
+}
+
+sent_messages = OrderedDict()
+
+
+class RateLimited(ConnectionError):
+    """API домашки ограничил частоту запросов (HTTP 429)."""
+
+    def __init__(self, retry_after=None):
+        """Сохраняет задержку из заголовка Retry-After (в секундах)."""
+        super().__init__(f"Превышен лимит запросов: {retry_after}")
+        self.retry_after = retry_after
 
 
 def check_tokens():
     """Проверяет доступность переменных окружения."""
-    env_vars = {
-        'PRACTICUM_TOKEN': PRACTICUM_TOKEN,
-        'TELEGRAM_TOKEN': TELEGRAM_TOKEN,
-        'TELEGRAM_CHAT_ID': TELEGRAM_CHAT_ID
+    tokens = {
+        "PRACTICUM_TOKEN": PRACTICUM_TOKEN,
+        "TELEGRAM_TOKEN": TELEGRAM_TOKEN,
+        "TELEGRAM_CHAT_ID": TELEGRAM_CHAT_ID,
     }
-    empty_tokens = []
-    for key, value in env_vars.items():
-        if not value:
-            empty_tokens.append(key)
-    return empty_tokens
+    return [name for name, value in tokens.items() if not value]
 
 
 def send_message(bot, message):
     """Отправляет сообщение в Telegram чат."""
-    logging.debug(f"Отправка боту: {bot} сообщения: {message}")
+    logger.debug("Отправка боту: %s сообщения: %s", bot, message)
     try:
         bot.send_message(
             chat_id=TELEGRAM_CHAT_ID,
             text=message,
         )
-        logging.debug("Успешная отправка сообщения в Telegram")
+        logger.debug("Успешная отправка сообщения в Telegram")
     except telegram.error.TelegramError as error:
-        logging.error(f"Ошибка при отправке сообщения: {error}")
-        raise telegram.error.TelegramError
+        logger.error("Ошибка при отправке сообщения: %s", error)
+        raise
 
 
 def get_api_answer(timestamp):
     """Делает запрос к единственному эндпоинту API-сервиса."""
     params = {"from_date": timestamp}
-    logging.debug(f"{ENDPOINT}, headers {HEADERS}, params{params}, timeout=5")
+    logger.debug(
+        "%s, params %s, timeout %s", ENDPOINT, params, REQUEST_TIMEOUT
+    )
     try:
         homework_status = requests.get(
-            ENDPOINT, headers=HEADERS, params=params, timeout=5
+            ENDPOINT, headers=HEADERS, params=params, timeout=REQUEST_TIMEOUT
         )
     except requests.RequestException as error:
         raise ConnectionError(f"Ошибка при запросе к API: {error}")
+    if homework_status.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+        retry_after = homework_status.headers.get("Retry-After")
+        raise RateLimited(
+            int(retry_after) if retry_after and retry_after.isdigit() else None
+        )
     if homework_status.status_code != HTTPStatus.OK:
         raise ConnectionError(f"Ответ сервера: {homework_status.status_code}")
     return homework_status.json()
@@ -71,7 +105,7 @@ def get_api_answer(timestamp):
 
 def check_response(response):
     """Проверяет ответ API на соответствие документации."""
-    logging.debug(f"Начинается проверка ответа API: {response}")
+    logger.debug("Начинается проверка ответа API: %s", response)
     if not isinstance(response, dict):
         raise TypeError("Данные приходят не в виде словаря")
     if "homeworks" not in response:
@@ -86,71 +120,126 @@ def check_response(response):
 
 def parse_status(homework):
     """Извлекает из информации о конкретной домашней работе статус."""
-    logging.debug("Начали парсинг статуса")
-    homework_name = homework.get("homework_name")
-    if not homework_name:
-        raise KeyError("Нет ключа 'homework_name'")
-    status = homework.get("status")
-    if not status:
-        raise KeyError("Нет ключа 'status'")
-    verdict = HOMEWORK_VERDICTS.get(status)
-    if not verdict:
-        raise KeyError("API домашки возвращает недокументированный статус")
-    return f'Изменился статус проверки работы "{homework_name}". {verdict}'
-
-
-def check_message(bot, message, previous_message):
-    """Функция отправляет сообщение боту, если оно изменилось."""
-    if message != previous_message:
-        send_message(bot, message)
+    logger.debug("Начали парсинг статуса")
+    try:
+        homework_name = homework["homework_name"]
+        status = homework["status"]
+    except KeyError as error:
+        raise KeyError(f"Нет ключа {error}") from None
+    try:
+        message = HOMEWORK_VERDICT_MESSAGES[status]
+    except KeyError:
+        raise KeyError(
+            "API домашки возвращает недокументированный статус"
+        ) from None
+    return message.format(name=homework_name)
+
+
+def get_backoff(error, backoff):
+    """Вычисляет паузу перед следующим запросом после ошибки соединения."""
+    max_period = max(MAX_RETRY_PERIOD, RETRY_PERIOD)
+    backoff = min(backoff * 2, max_period)
+    if isinstance(error, RateLimited) and error.retry_after:
+        return min(max(error.retry_after, backoff), max_period)
+    return backoff
+
+
+def get_sent_messages_ttl():
+    """Возвращает срок подавления повторов: не короче двух пауз подряд."""
+    return max(SENT_MESSAGES_TTL, 2 * max(MAX_RETRY_PERIOD, RETRY_PERIOD))
+
+
+def get_error_message(error):
+    """Формирует текст сообщения об ошибке для отправки в Telegram."""
+    for error_type, prefix in ERROR_PREFIXES.items():
+        if isinstance(error, error_type):
+            break
     else:
-        logging.debug("Повтор сообщения, не отправляется боту")
-    return message
+        prefix = "Сбой в работе программы"
+    return f"{prefix}: {type(error).__name__}"
+
+
+def check_message(bot, message):
+    """Функция отправляет сообщение боту, если оно не отправлялось недавно."""
+    digest = hashlib.blake2b(message.encode(), digest_size=8).digest()
+    now = time.monotonic()
+    seen_at = sent_messages.get(digest)
+    if seen_at is not None and now - seen_at < get_sent_messages_ttl():
+        sent_messages[digest] = now
+        sent_messages.move_to_end(digest)
+        logger.debug("Повтор сообщения, не отправляется боту")
+        return
+    send_message(bot, message)
+    sent_messages[digest] = now
+    sent_messages.move_to_end(digest)
+    if len(sent_messages) > SENT_MESSAGES_LIMIT:
+        sent_messages.popitem(last=False)
+
+
+def report_error(bot, error):
+    """Логирует ошибку и сообщает о ней в Telegram, если он доступен."""
+    message = get_error_message(error)
+    logger.exception(message)
+    if isinstance(error, telegram.error.TelegramError):
+        return
+    with suppress(telegram.error.TelegramError):
+        check_message(bot, message)
+
+
+def send_statuses(bot, homeworks):
+    """Отправляет статусы всех домашних работ, пропуская некорректные."""
+    for homework in homeworks:
+        try:
+            message = parse_status(homework)
+        except (KeyError, TypeError) as error:
+            report_error(bot, error)
+            continue
+        check_message(bot, message)
+
+
+def handle_sigterm(signum, frame):
+    """Останавливает бота по сигналу SIGTERM, не дожидаясь конца паузы."""
+    logger.info("Получен сигнал SIGTERM, бот останавливается")
+    sys.exit(0)
 
 
 def main():
     """Основная логика работы бота."""
     empty_tokens = check_tokens()
     if empty_tokens:
-        logging.critical(f'Не найдены токены: {" ".join(empty_tokens)}')
-        sys.exit()
+        logger.critical("Не найдены токены: %s", " ".join(empty_tokens))
+        sys.exit(1)
+    sent_messages.clear()
     try:
         bot = telegram.Bot(token=TELEGRAM_TOKEN)
     except Exception as error:
-        logging.critical(f"Ошибка при создании экземпляра Bot(): {error}")
-        sys.exit()
+        logger.critical("Ошибка при создании экземпляра Bot(): %s", error)
+        sys.exit(1)
     timestamp = int(time.time())
-    previous_message = ""
+    backoff = RETRY_PERIOD
     while True:
+        retry_period = RETRY_PERIOD
         try:
-            homework = check_response(get_api_answer(timestamp))
-            if homework:
-                message = parse_status(homework[0])
-                previous_message = check_message(bot, message,
-                                                 previous_message)
+            homeworks = check_response(get_api_answer(timestamp))
+            backoff = RETRY_PERIOD
+            if homeworks:
+                send_statuses(bot, homeworks)
             else:
-                logging.debug("Нет новых данных")
-        except ConnectionError as error:
-            message = f"Ошибка соединения: {error}"
-            logging.exception(message)
-            previous_message = check_message(bot, message, previous_message)
-        except TypeError as error:
-            message = f"Объект несоответствующего типа: {error}"
-            logging.exception(message)
-            previous_message = check_message(bot, message, previous_message)
+                logger.debug("Нет новых данных")
         except Exception as error:
-            message = f"Сбой в работе программы: {error}"
-            logging.exception(message)
-            previous_message = check_message(bot, message, previous_message)
-        finally:
-            time.sleep(RETRY_PERIOD)
+            if isinstance(error, ConnectionError):
+                backoff = get_backoff(error, backoff)
+                retry_period = backoff + random.uniform(0, backoff * 0.1)
+            report_error(bot, error)
+        time.sleep(retry_period)
 
 
 if __name__ == "__main__":
     logging.basicConfig(
-        level=logging.DEBUG,
+        level=os.getenv("LOG_LEVEL", "INFO").upper(),
         format=(
             '%(asctime)s, %(name)s, %(levelname)s, %(message)s'
         ),
     )
+    signal.signal(signal.SIGTERM, handle_sigterm)
     main()
@@ -1,8 +1,11 @@
 import inspect
 import logging
 import platform
+import random
 import re
+import signal
 import time
+from collections import OrderedDict
 from http import HTTPStatus
 
 import pytest
@@ -230,6 +233,22 @@ class TestHomework:
             f'Проверьте, что функция `{func_name}` возвращает словарь.'
         )
 
+    def test_get_api_answer_does_not_log_token(self, monkeypatch, caplog,
+                                               random_timestamp,
+                                               current_timestamp,
+                                               homework_module):
+        monkeypatch.setattr(
+            requests, 'get',
+            create_mock_response_get_with_custom_status_and_data(
+                random_timestamp, HTTPStatus.OK, None
+            )
+        )
+        with caplog.at_level(logging.DEBUG):
+            homework_module.get_api_answer(current_timestamp)
+        assert homework_module.PRACTICUM_TOKEN not in caplog.text, (
+            'Убедитесь, что токен Практикума не попадает в логи.'
+        )
+
     @pytest.mark.parametrize('response', NOT_OK_RESPONSES.values())
     def test_get_not_200_status_response(self,
                                          monkeypatch,
@@ -279,6 +298,63 @@ class TestHomework:
         except Exception:
             pass
 
+    def test_get_api_answer_rate_limited(self, monkeypatch, current_timestamp,
+                                         homework_module):
+        def mock_response_get(*args, **kwargs):
+            response = utils.MockResponseGET(
+                *args, http_status=HTTPStatus.TOO_MANY_REQUESTS, **kwargs
+            )
+            response.headers = {'Retry-After': '120'}
+            return response
+
+        monkeypatch.setattr(requests, 'get', mock_response_get)
+        with pytest.raises(homework_module.RateLimited) as error:
+            homework_module.get_api_answer(current_timestamp)
+        assert error.value.retry_after == 120, (
+            'Убедитесь, что при ответе 429 учитывается заголовок '
+            '`Retry-After`.'
+        )
+        assert isinstance(error.value, ConnectionError), (
+            '`RateLimited` должен наследоваться от `ConnectionError`.'
+        )
+
+    def test_get_backoff(self, monkeypatch, homework_module):
+        get_backoff = homework_module.get_backoff
+        rate_limited = homework_module.RateLimited
+        max_period = homework_module.MAX_RETRY_PERIOD
+        assert get_backoff(ConnectionError(), 600) == 1200, (
+            'Убедитесь, что пауза удваивается после ошибки соединения.'
+        )
+        assert get_backoff(ConnectionError(), max_period) == max_period, (
+            'Убедитесь, что пауза не превышает `MAX_RETRY_PERIOD`.'
+        )
+        assert get_backoff(rate_limited(30), 1200) == 2400, (
+            'Убедитесь, что `Retry-After` не сокращает паузу.'
+        )
+        assert get_backoff(rate_limited(3000), 600) == 3000, (
+            'Убедитесь, что пауза не меньше значения `Retry-After`.'
+        )
+        assert get_backoff(rate_limited(5000), 600) == max_period, (
+            'Убедитесь, что пауза не превышает `MAX_RETRY_PERIOD`.'
+        )
+        monkeypatch.setattr(homework_module, 'RETRY_PERIOD', 7200)
+        assert get_backoff(ConnectionError(), 7200) == 7200, (
+            'Убедитесь, что после ошибки пауза не короче `RETRY_PERIOD`.'
+        )
+
+    def test_get_error_message(self, homework_module):
+        get_error_message = homework_module.get_error_message
+        expected = {
+            homework_module.RateLimited(30): 'Ошибка соединения: RateLimited',
+            TypeError('x'): 'Объект несоответствующего типа: TypeError',
+            KeyError('x'): 'Сбой в работе программы: KeyError',
+        }
+        for error, message in expected.items():
+            assert get_error_message(error) == message, (
+                'Убедитесь, что текст ошибки строится из префикса '
+                'и имени класса исключения.'
+            )
+
     def test_parse_status_with_expected_statuses(self, homework_module):
         func_name = 'parse_status'
         utils.check_function(
@@ -491,6 +567,93 @@ class TestHomework:
                 'метод бота `send_message`.'
             )
 
+    def test_send_message_reraises_original_error(self, homework_module):
+        original = telegram.error.RetryAfter(30)
+
+        class MockedBotWithException(utils.MockTelegramBot):
+            def send_message(self, *args, **kwargs):
+                raise original
+
+        with pytest.raises(telegram.error.TelegramError) as error:
+            homework_module.send_message(MockedBotWithException(), 'text')
+        assert error.value is original, (
+            'Убедитесь, что `send_message` пробрасывает исходное '
+            'исключение Telegram, а не создаёт новое.'
+        )
+
+    def test_report_error_survives_telegram_errors(self, monkeypatch,
+                                                   homework_module):
+        sent = []
+
+        def send_message_with_exception(bot, message):
+            sent.append(message)
+            raise telegram.error.NetworkError('Something wrong')
+
+        monkeypatch.setattr(
+            homework_module, 'send_message', send_message_with_exception
+        )
+        monkeypatch.setattr(homework_module, 'sent_messages', OrderedDict())
+        errors = (
+            ConnectionError('API down'),
+            telegram.error.NetworkError('Telegram down'),
+        )
+        for error in errors:
+            try:
+                raise error
+            except Exception as caught:
+                homework_module.report_error(None, caught)
+        assert sent == ['Ошибка соединения: ConnectionError'], (
+            'Убедитесь, что ошибка отправки отчёта в Telegram не прерывает '
+            'работу бота, а сбои самого Telegram в него не отправляются.'
+        )
+
+    def test_check_message_skips_recent_duplicates(self, monkeypatch,
+                                                   homework_module):
+        sent = []
+        monkeypatch.setattr(homework_module, 'SENT_MESSAGES_LIMIT', 2)
+        monkeypatch.setattr(homework_module, 'sent_messages', OrderedDict())
+        monkeypatch.setattr(
+            homework_module, 'send_message',
+            lambda bot, message: sent.append(message)
+        )
+        messages = ('first', 'second', 'first', 'third', 'first', 'second')
+        for message in messages:
+            homework_module.check_message(None, message)
+        assert sent == ['first', 'second', 'third', 'second'], (
+            'Убедитесь, что `check_message` не отправляет повторно '
+            'недавние сообщения и забывает давно не встречавшиеся.'
+        )
+
+    def test_check_message_resends_after_ttl(self, monkeypatch,
+                                             homework_module):
+        sent = []
+        clock = [0]
+        monkeypatch.setattr(homework_module, 'SENT_MESSAGES_TTL', 3600)
+        monkeypatch.setattr(homework_module, 'sent_messages', OrderedDict())
+        monkeypatch.setattr(time, 'monotonic', lambda: clock[0])
+        monkeypatch.setattr(
+            homework_module, 'send_message',
+            lambda bot, message: sent.append(message)
+        )
+        homework = {'homework_name': 'hw123'}
+        for seconds, status in ((0, 'reviewing'), (600, 'rejected'),
+                                (1200, 'reviewing'), (1800, 'rejected'),
+                                (9000, 'reviewing'), (9600, 'approved')):
+            clock[0] = seconds
+            homework['status'] = status
+            homework_module.check_message(
+                None, homework_module.parse_status(homework)
+            )
+        assert [message.split('. ', 1)[1] for message in sent] == [
+            self.HOMEWORK_VERDICTS['reviewing'],
+            self.HOMEWORK_VERDICTS['rejected'],
+            self.HOMEWORK_VERDICTS['reviewing'],
+            self.HOMEWORK_VERDICTS['approved'],
+        ], (
+            'Убедитесь, что `check_message` подавляет кратковременные '
+            'повторы, но снова отправляет статус после `SENT_MESSAGES_TTL`.'
+        )
+
     def test_bot_initialized_in_main(self, homework_module):
         func_name = 'main'
         utils.check_function(
@@ -734,6 +897,194 @@ class TestHomework:
                     f'Вызов функции `main` завершился ошибкой: {e}'
                 ) from e
 
+    def test_main_send_message_for_every_homework(self, monkeypatch,
+                                                  random_timestamp,
+                                                  current_timestamp,
+                                                  random_message,
+                                                  homework_module):
+        response_data = {
+            'homeworks': [
+                {'homework_name': 'hw123', 'status': 'approved'},
+                {'homework_name': 'hw789', 'status': 'unknown'},
+                None,
+                'hw000',
+                {'homework_name': 'hw456', 'status': 'rejected'},
+            ],
+            'current_date': random_timestamp
+        }
+        self.mock_main(
+            monkeypatch,
+            random_message,
+            random_timestamp,
+            current_timestamp,
+            homework_module,
+            response_data=response_data
+        )
+        sent = []
+        monkeypatch.setattr(homework_module, 'sent_messages', OrderedDict())
+        monkeypatch.setattr(
+            homework_module, 'send_message',
+            lambda bot, message: sent.append(message)
+        )
+        try:
+            homework_module.main()
+        except utils.BreakInfiniteLoop:
+            pass
+        for name in ('hw123', 'hw456'):
+            assert any(name in message for message in sent), (
+                'Убедитесь, что бот отправляет сообщение для каждой '
+                'корректной домашней работы из ответа API.'
+            )
+        assert 'Сбой в работе программы: KeyError' in sent, (
+            'Убедитесь, что бот сообщает о домашней работе, статус '
+            'которой не удалось разобрать.'
+        )
+        assert 'Объект несоответствующего типа: TypeError' in sent, (
+            'Убедитесь, что бот сообщает о записи в `homeworks`, '
+            'которая не является словарём.'
+        )
+
+    def test_main_exits_without_pause_on_system_exit(self, monkeypatch,
+                                                      random_message,
+                                                      homework_module):
+        monkeypatch.setattr(homework_module, 'PRACTICUM_TOKEN', 'sometoken')
+        monkeypatch.setattr(homework_module, 'TELEGRAM_TOKEN', '1234:abcdefg')
+        monkeypatch.setattr(homework_module, 'TELEGRAM_CHAT_ID', '12345')
+        get_mock_telegram_bot(monkeypatch, random_message)
+        sleeps = []
+        monkeypatch.setattr(time, 'sleep', sleeps.append)
+
+        def mock_request_get_with_exit(*args, **kwargs):
+            raise SystemExit(0)
+
+        monkeypatch.setattr(requests, 'get', mock_request_get_with_exit)
+        with pytest.raises(SystemExit):
+            homework_module.main()
+        assert not sleeps, (
+            'Убедитесь, что при остановке бота во время запроса к API '
+            '`main()` завершается сразу, без паузы `time.sleep()`.'
+        )
+
+    def run_main_with_clock(self, monkeypatch, homework_module, outcomes,
+                            send_message=None):
+        """
+        Run main() against a fake clock: each poll takes the next outcome
+        (an API answer or an exception), and time.sleep advances the clock.
+        Returns the (time, message) pairs sent and the pauses slept.
+        """
+        monkeypatch.setattr(homework_module, 'PRACTICUM_TOKEN', 'sometoken')
+        monkeypatch.setattr(homework_module, 'TELEGRAM_TOKEN', '1234:abcdefg')
+        monkeypatch.setattr(homework_module, 'TELEGRAM_CHAT_ID', '12345')
+        monkeypatch.setattr(homework_module, 'sent_messages', OrderedDict())
+        monkeypatch.setattr(
+            telegram, 'Bot', lambda *args, **kwargs: utils.MockTelegramBot()
+        )
+        monkeypatch.setattr(random, 'uniform', lambda low, high: high)
+        outcomes = list(outcomes)
+        clock = [0]
+        sent = []
+        sleeps = []
+
+        def mock_get_api_answer(timestamp):
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        def mock_send_message(bot, message):
+            if send_message is not None:
+                send_message(bot, message)
+            sent.append((clock[0], message))
+
+        def mock_sleep(secs):
+            sleeps.append(secs)
+            clock[0] += secs
+            if not outcomes:
+                raise utils.BreakInfiniteLoop('break')
+
+        monkeypatch.setattr(time, 'monotonic', lambda: clock[0])
+        monkeypatch.setattr(time, 'sleep', mock_sleep)
+        monkeypatch.setattr(
+            homework_module, 'get_api_answer', mock_get_api_answer
+        )
+        monkeypatch.setattr(homework_module, 'send_message', mock_send_message)
+        with pytest.raises(utils.BreakInfiniteLoop):
+            homework_module.main()
+        return sent, sleeps
+
+    def test_main_resets_backoff_when_api_recovers(self, monkeypatch,
+                                                   homework_module,
+                                                   data_with_new_hw_status):
+        def send_message_with_exception(bot, message):
+            raise telegram.error.NetworkError('Something wrong')
+
+        _, sleeps = self.run_main_with_clock(
+            monkeypatch, homework_module,
+            (ConnectionError('API down'), data_with_new_hw_status,
+             ConnectionError('API down')),
+            send_message=send_message_with_exception
+        )
+        assert sleeps == [1320, 600, 1320], (
+            'Убедитесь, что пауза после ошибок API сбрасывается, как только '
+            'API ответил, даже если отправка в Telegram не удалась.'
+        )
+
+    def test_main_no_resend_after_outage_at_backoff_cap(
+            self, monkeypatch, homework_module, data_with_new_hw_status):
+        sent, sleeps = self.run_main_with_clock(
+            monkeypatch, homework_module,
+            (data_with_new_hw_status, homework_module.RateLimited(3600),
+             data_with_new_hw_status)
+        )
+        statuses = [time for time, message in sent
+                    if message.startswith('Изменился статус')]
+        assert sleeps[1] > homework_module.MAX_RETRY_PERIOD
+        assert statuses == [0], (
+            'Убедитесь, что после паузы на максимальном интервале '
+            'неизменившийся статус не отправляется повторно.'
+        )
+
+    def test_main_no_resend_when_retry_period_exceeds_ttl(
+            self, monkeypatch, homework_module, data_with_new_hw_status):
+        monkeypatch.setattr(homework_module, 'RETRY_PERIOD', 7200)
+        monkeypatch.setattr(homework_module, 'SENT_MESSAGES_TTL', 3600)
+        sent, sleeps = self.run_main_with_clock(
+            monkeypatch, homework_module, (data_with_new_hw_status,) * 3
+        )
+        assert sleeps == [7200] * 3
+        assert [time for time, message in sent] == [0], (
+            'Убедитесь, что срок подавления повторов не короче '
+            '`RETRY_PERIOD`.'
+        )
+
+    def test_main_stops_on_sigterm_during_pause(self, monkeypatch, caplog,
+                                                random_timestamp,
+                                                random_message,
+                                                homework_module):
+        monkeypatch.setattr(homework_module, 'PRACTICUM_TOKEN', 'sometoken')
+        monkeypatch.setattr(homework_module, 'TELEGRAM_TOKEN', '1234:abcdefg')
+        monkeypatch.setattr(homework_module, 'TELEGRAM_CHAT_ID', '12345')
+        get_mock_telegram_bot(monkeypatch, random_message)
+        monkeypatch.setattr(
+            requests, 'get',
+            create_mock_response_get_with_custom_status_and_data(
+                random_timestamp, HTTPStatus.OK, None
+            )
+        )
+        monkeypatch.setattr(
+            time, 'sleep',
+            lambda secs: homework_module.handle_sigterm(signal.SIGTERM, None)
+        )
+        with caplog.at_level(logging.INFO):
+            with pytest.raises(SystemExit) as error:
+                homework_module.main()
+        assert error.value.code == 0, (
+            'Убедитесь, что по сигналу SIGTERM бот завершается с кодом 0.'
+        )
+        assert 'Получен сигнал SIGTERM' in caplog.text, (
+            'Убедитесь, что остановка бота по сигналу SIGTERM логируется.'
+        )
+
     def test_main_send_message_with_telegram_exception(self, monkeypatch,
                                                        random_timestamp,
                                                        current_timestamp,